@@ -10,7 +10,7 @@ from ymmsl import (
         PartialConfiguration, Ports, Reference, Settings, ThreadedResReq)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_yaml1() -> str:
     text = ('ymmsl_version: v0.1\n'
             'settings:\n'
@@ -35,7 +35,7 @@ def test_config1() -> PartialConfiguration:
     return PartialConfiguration(None, settings)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_yaml2() -> str:
     text = ('ymmsl_version: v0.1\n'
             'model:\n'
@@ -74,7 +74,7 @@ def test_config2() -> PartialConfiguration:
     return PartialConfiguration(model)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_yaml3() -> str:
     text = ('ymmsl_version: v0.1\n'
             'model:\n'
@@ -88,7 +88,7 @@ def test_config3() -> PartialConfiguration:
     return PartialConfiguration(model)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_yaml4() -> str:
     text = ('ymmsl_version: v0.1\n'
             'implementations:\n'
@@ -170,7 +170,7 @@ def test_config4() -> PartialConfiguration:
                                 description, checkpoints, resume)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_yaml5() -> str:
     text = ('ymmsl_version: v0.1\n'
             'model:\n'
@@ -246,7 +246,7 @@ def test_config5() -> Configuration:
     return Configuration(model, None, implementations, resources)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_yaml6() -> str:
     text = ('ymmsl_version: v0.1\n'
             'model:\n'
@@ -329,7 +329,7 @@ def test_config6() -> Configuration:
     return Configuration(model, None, implementations, resources)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_yaml7() -> str:
     text = (
             'ymmsl_version: v0.1\n'
@@ -373,7 +373,7 @@ def test_config7() -> Configuration:
     return Configuration(model)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_yaml8() -> str:
     text = (
             'ymmsl_version: v0.1\n'
@@ -487,3 +487,23 @@ def test_config8() -> Configuration:
 
     return Configuration(model, None, implementations, resources,
             description, checkpoints, resume)
+
+
+@pytest.fixture(scope='session')
+def test_yaml9() -> str:
+    text = ('ymmsl_version: v0.1\n'
+            'description: "Ein Modell f\\xFCr die \\xDCberpr\\xFCfung der'
+            ' Ausgabe, mit einer sehr\\\n'
+            '  \\ langen Zeile, die \\xFCber die Breite hinausgeht und'
+            ' gefaltet werden muss \\u2014\\\n'
+            '  \\ wirklich sehr lang."\n')
+    return text
+
+
+@pytest.fixture
+def test_config9() -> PartialConfiguration:
+    description = (
+            'Ein Modell f\u00fcr die \u00dcberpr\u00fcfung der Ausgabe, mit'
+            ' einer sehr langen Zeile, die \u00fcber die Breite hinausgeht'
+            ' und gefaltet werden muss \u2014 wirklich sehr lang.')
+    return PartialConfiguration(description=description)
@@ -7,10 +7,20 @@ from ymmsl.checkpoint import (
         CheckpointRangeRule, CheckpointAtRule, CheckpointRule, Checkpoints)
 
 
-def test_checkpointrange():
-    dumps = yatiml.dumps_function(CheckpointRangeRule)
-    load = yatiml.load_function(CheckpointRangeRule)
+load_range_rule = yatiml.load_function(CheckpointRangeRule)
+
+
+dump_range_rule = yatiml.dumps_function(CheckpointRangeRule)
+
+
+load_checkpoints = yatiml.load_function(
+        Checkpoints, CheckpointRangeRule, CheckpointAtRule, CheckpointRule)
 
+
+load_at_rule = yatiml.load_function(CheckpointAtRule)
+
+
+def test_checkpointrange():
     with pytest.raises(ValueError):
         CheckpointRangeRule()
 
@@ -18,7 +28,7 @@ def test_checkpointrange():
     assert cp_range.start is None
     assert cp_range.stop is None
     assert cp_range.every == 1
-    cp_range = load(dumps(cp_range))
+    cp_range = load_range_rule(dump_range_rule(cp_range))
     assert cp_range.start is None
     assert cp_range.stop is None
     assert cp_range.every == 1
@@ -27,7 +37,7 @@ def test_checkpointrange():
     assert cp_range.start == 1
     assert cp_range.every == 2
     assert cp_range.stop == 99
-    cp_range = load(dumps(cp_range))
+    cp_range = load_range_rule(dump_range_rule(cp_range))
     assert cp_range.start == 1
     assert cp_range.every == 2
     assert cp_range.stop == 99
@@ -44,19 +54,36 @@ def test_checkpointrange():
 
 
 def test_checkpoints():
-    dumps = yatiml.dumps_function(CheckpointRangeRule)
-    load = yatiml.load_function(CheckpointRangeRule)
+    checkpoints = Checkpoints()
+    assert checkpoints.at_end is False
+    assert checkpoints.wallclock_time == []
+    assert checkpoints.simulation_time == []
+    assert not checkpoints
+
+    checkpoints = load_checkpoints(
+            "wallclock_time: [{every: 600}]\n"
+            "simulation_time: [{at: [2, 1]}]")
+    assert checkpoints
+    assert checkpoints.at_end is False
+    assert len(checkpoints.wallclock_time) == 1
+    assert isinstance(checkpoints.wallclock_time[0], CheckpointRangeRule)
+    assert checkpoints.wallclock_time[0].every == 600
+    assert len(checkpoints.simulation_time) == 1
+    assert isinstance(checkpoints.simulation_time[0], CheckpointAtRule)
+    assert checkpoints.simulation_time[0].at == [1, 2]
+
+    assert load_checkpoints("at_end: true")
 
 
 def test_checkpointrules_update():
-    load = yatiml.load_function(
-            Checkpoints, CheckpointRangeRule, CheckpointAtRule, CheckpointRule)
-    rule1 = load("simulation_time: [{every: 300}]")
-    rule2 = load("wallclock_time: [{at: [10, 20]}]")
-    rule3 = load("wallclock_time: [{at: [15, 5]}]")
-    rule4 = load("wallclock_time: [{start: 0, stop: 50, every: 10}]")
-    rule5 = load("simulation_time: [{start: 50, stop: 100, every: 10}]")
-    rule6 = load("at_end: true")
+    rule1 = load_checkpoints("simulation_time: [{every: 300}]")
+    rule2 = load_checkpoints("wallclock_time: [{at: [10, 20]}]")
+    rule3 = load_checkpoints("wallclock_time: [{at: [15, 5]}]")
+    rule4 = load_checkpoints(
+            "wallclock_time: [{start: 0, stop: 50, every: 10}]")
+    rule5 = load_checkpoints(
+            "simulation_time: [{start: 50, stop: 100, every: 10}]")
+    rule6 = load_checkpoints("at_end: true")
 
     rule2.update(rule3)
     assert rule2.simulation_time == []
@@ -82,10 +109,8 @@ def test_checkpointrules_update():
 
 
 def test_checkpointrules_scalar_at():
-    load = yatiml.load_function(CheckpointAtRule)
-
-    rule = load("at: 5")
+    rule = load_at_rule("at: 5")
     assert rule.at == [5]
 
-    rule = load("at: 1e-12")
+    rule = load_at_rule("at: 1e-12")
     assert rule.at == [1e-12]
@@ -1,4 +1,4 @@
-from typing import Iterable
+from typing import Any, Iterable, List
 
 import pytest
 
@@ -65,28 +65,25 @@ def test_ports() -> None:
         p3.operator(Identifier('x'))
 
 
-def test_component_declaration() -> None:
-    test_decl = Component('test', 'ns.model')
-    assert str(test_decl.name) == 'test'
-    assert str(test_decl.implementation) == 'ns.model'
-    assert test_decl.multiplicity == []
-    assert str(test_decl) == 'test'
-
-    test_decl = Component('test', 'ns.model', 10)
+@pytest.mark.parametrize(
+        'implementation, multiplicity, expected_multiplicity, expected_str', [
+            ('ns.model', None, [], 'test'),
+            ('ns.model', 10, [10], 'test[0:10]'),
+            ('ns2.model2', [1, 2], [1, 2], 'test[0:1][0:2]')])
+def test_component_declaration(
+        implementation: str, multiplicity: Any,
+        expected_multiplicity: List[int], expected_str: str) -> None:
+    test_decl = Component('test', implementation, multiplicity)
     assert isinstance(test_decl.name, Reference)
-    assert str(test_decl.name) == 'test'
-    assert test_decl.multiplicity == [10]
-    assert str(test_decl) == 'test[0:10]'
+    assert test_decl.name == 'test'
+    assert test_decl.implementation == implementation
+    assert test_decl.multiplicity == expected_multiplicity
+    assert str(test_decl) == expected_str
 
-    test_decl = Component('test', 'ns2.model2', [1, 2])
-    assert isinstance(test_decl.name, Reference)
-    assert str(test_decl.name) == 'test'
-    assert str(test_decl.implementation) == 'ns2.model2'
-    assert test_decl.multiplicity == [1, 2]
-    assert str(test_decl) == 'test[0:1][0:2]'
 
+def test_component_declaration_subscripted_implementation() -> None:
     with pytest.raises(ValueError):
-        test_decl = Component('test', 'ns2.model2[1]')
+        Component('test', 'ns2.model2[1]')
 
 
 def test_component_instances() -> None:
@@ -6,12 +6,12 @@ import yatiml
 from ymmsl.document import Document
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def load_document() -> Callable:
     return yatiml.load_function(Document)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def dump_document() -> Callable:
     return yatiml.dumps_function(Document)
 
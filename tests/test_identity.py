@@ -1,9 +1,17 @@
+import copy
+
 from ymmsl import Identifier, Reference
 
 import pytest
 import yatiml
 
 
+load_reference = yatiml.load_function(Reference, Identifier)
+
+
+dump_reference = yatiml.dumps_function(Identifier, Reference)
+
+
 def test_create_identifier() -> None:
     part = Identifier('testing')
     assert str(part) == 'testing'
@@ -20,6 +28,9 @@ def test_create_identifier() -> None:
     part = Identifier('digits123')
     assert str(part) == 'digits123'
 
+    part = Identifier('class')
+    assert str(part) == 'class'
+
     with pytest.raises(ValueError):
         Identifier('1initialdigit')
 
@@ -35,6 +46,12 @@ def test_create_identifier() -> None:
     with pytest.raises(ValueError):
         Identifier('test/slash')
 
+    with pytest.raises(ValueError):
+        Identifier('')
+
+    with pytest.raises(ValueError):
+        Identifier('t\u00ebst')
+
 
 def test_compare_identifier() -> None:
     assert Identifier('test') == Identifier('test')
@@ -45,6 +62,9 @@ def test_compare_identifier() -> None:
     assert Identifier('test') != 'test2'
     assert 'test2' != Identifier('test')    # pylint: disable=C0122
 
+    assert isinstance(Identifier('test'), str)
+    assert Identifier('test') in {'test', 'test2'}
+
 
 def test_identifier_dict_key() -> None:
     test_dict = {Identifier('test'): 1}
@@ -126,6 +146,18 @@ def test_create_reference() -> None:
         Reference('[4].test')
 
 
+def test_reference_canonical_form() -> None:
+    assert str(Reference('test[03]')) == 'test[3]'
+    assert Reference('test[03]') == 'test[3]'
+    assert Reference('test[03]') == Reference('test[3]')
+    assert hash(Reference('test[03]')) == hash(Reference('test[3]'))
+    assert str(Reference('test[-1]')) == 'test[-1]'
+
+    test_ref = Reference([Identifier('test'), 3, Identifier('x')])
+    assert test_ref == Reference('test[3].x')
+    assert hash(test_ref) == hash(Reference('test[3].x'))
+
+
 def test_reference_slicing() -> None:
     test_ref = Reference('test[12].testing.ok.index[3][5]')
 
@@ -179,6 +211,10 @@ def test_reference_concatenation() -> None:
     assert (Reference('test[5]') + [3, Identifier('test2')] ==
             'test[5][3].test2')
 
+    test_ref = Reference('test')
+    assert test_ref + [Identifier('test2'), 5] == 'test.test2[5]'
+    assert test_ref == 'test'
+
 
 def test_reference_without_trailing_ints() -> None:
     Ref = Reference
@@ -187,17 +223,27 @@ def test_reference_without_trailing_ints() -> None:
     assert Ref('a.b.c').without_trailing_ints() == Ref('a.b.c')
     assert Ref('a[1].b.c[2]').without_trailing_ints() == Ref('a[1].b.c')
 
+    test_ref = Ref('a[1].b.c')
+    assert test_ref.without_trailing_ints() is test_ref
 
-def test_reference_io() -> None:
-    load_reference = yatiml.load_function(Reference, Identifier)
 
+def test_copy() -> None:
+    test_id = Identifier('test')
+    assert copy.copy(test_id) is test_id
+    assert copy.deepcopy(test_id) is test_id
+
+    test_ref = Reference('test[12].testing')
+    assert copy.copy(test_ref) is test_ref
+    assert copy.deepcopy(test_ref) is test_ref
+    assert copy.deepcopy([test_ref])[0] is test_ref
+
+
+def test_reference_io() -> None:
     text = 'test[12]'
     doc = load_reference(text)
     assert str(doc[0]) == 'test'
     assert doc[1] == 12
 
-    dump_reference = yatiml.dumps_function(Identifier, Reference)
-
     doc = Reference('test[12].testing.ok.index[3][5]')
     text = dump_reference(doc)
     assert text == 'test[12].testing.ok.index[3][5]\n...\n'
@@ -1,24 +1,46 @@
+from collections import OrderedDict
+import importlib
+from io import StringIO
 from pathlib import Path
-from typing import Any, cast
+import sys
+from threading import Thread
+from typing import Any
+from typing import List     # noqa: F401
 
 import pytest
 
+import yatiml
 from yatiml import RecognitionError
+import ymmsl.io
 from ymmsl import (
         Configuration, dump, load, save, Model, ModelReference,
         MPICoresResReq, MPINodesResReq, PartialConfiguration, Reference,
         ThreadedResReq, CheckpointRangeRule)
 
 
-@pytest.fixture
-def tmpdir_path(tmpdir: Any) -> Path:
-    return Path(str(tmpdir))
+@pytest.fixture(scope='module')
+def test_yaml1_file(test_yaml1: str, tmp_path_factory: Any) -> Path:
+    test_file = tmp_path_factory.mktemp('test_io') / 'test_yaml1.ymmsl'
+    with test_file.open('w') as f:
+        f.write(test_yaml1)
+    return test_file
+
+
+@pytest.mark.parametrize('index, expected_type', [
+    (1, PartialConfiguration), (2, PartialConfiguration),
+    (3, PartialConfiguration), (4, PartialConfiguration),
+    (5, Configuration), (6, Configuration),
+    (7, PartialConfiguration), (8, Configuration),
+    (9, PartialConfiguration)])
+def test_load_string(index: int, expected_type: Any, request: Any) -> None:
+    test_yaml = request.getfixturevalue('test_yaml{}'.format(index))
+    configuration = load(test_yaml)
+    assert type(configuration) is expected_type
+    assert dump(configuration) == test_yaml
 
 
 def test_load_string1(test_yaml1: str) -> None:
     configuration = load(test_yaml1)
-    assert isinstance(configuration, PartialConfiguration)
-    assert not isinstance(configuration, Configuration)
     settings = configuration.settings
     assert settings is not None
     assert len(settings) == 4
@@ -34,32 +56,26 @@ def test_load_string1(test_yaml1: str) -> None:
 
 def test_load_string2(test_yaml2: str) -> None:
     configuration = load(test_yaml2)
-    assert isinstance(configuration, PartialConfiguration)
-    assert not isinstance(configuration, Configuration)
     model = configuration.model
     assert isinstance(model, Model)
-    assert str(model.name) == 'test_model'
+    assert model.name == 'test_model'
     assert len(model.components) == 5
-    assert str(model.components[4].name) == 'bf2smc'
-    assert str(model.components[2].implementation) == 'isr2d.blood_flow'
+    assert model.components[4].name == 'bf2smc'
+    assert model.components[2].implementation == 'isr2d.blood_flow'
     assert len(model.conduits) == 5
-    assert str(model.conduits[0].sender) == 'ic.out'
-    assert str(model.conduits[1].sending_port()) == 'cell_positions'
-    assert str(model.conduits[3].receiving_component()) == 'bf2smc'
+    assert model.conduits[0].sender == 'ic.out'
+    assert model.conduits[1].sending_port() == 'cell_positions'
+    assert model.conduits[3].receiving_component() == 'bf2smc'
 
 
 def test_load_string3(test_yaml3: str) -> None:
     configuration = load(test_yaml3)
-    assert isinstance(configuration, PartialConfiguration)
-    assert not isinstance(configuration, Configuration)
     assert isinstance(configuration.model, ModelReference)
-    assert str(configuration.model.name) == 'test_model'
+    assert configuration.model.name == 'test_model'
 
 
 def test_load_string4(test_yaml4: str) -> None:
     configuration = load(test_yaml4)
-    assert isinstance(configuration, PartialConfiguration)
-    assert not isinstance(configuration, Configuration)
     assert len(configuration.implementations) == 5
     impls = configuration.implementations
     ic = Reference('isr2d.initial_conditions')
@@ -90,7 +106,6 @@ def test_load_string5(test_yaml5: str) -> None:
 
 def test_load_string6(test_yaml6: str) -> None:
     configuration = load(test_yaml6)
-    assert isinstance(configuration, PartialConfiguration)
     res = configuration.resources
     assert len(res) == 6
 
@@ -126,8 +141,6 @@ def test_load_string6(test_yaml6: str) -> None:
 
 def test_load_string7(test_yaml7: str) -> None:
     configuration = load(test_yaml7)
-    assert isinstance(configuration, PartialConfiguration)
-
     assert isinstance(configuration.model, Model)
     components = configuration.model.components
     assert components is not None
@@ -147,97 +160,68 @@ def test_load_string7(test_yaml7: str) -> None:
 
 def test_load_string8(test_yaml8: str) -> None:
     configuration = load(test_yaml8)
-    assert isinstance(configuration, PartialConfiguration)
-
     checkpoints = configuration.checkpoints
     assert checkpoints.simulation_time == []
     assert len(checkpoints.wallclock_time) == 1
     rule = checkpoints.wallclock_time[0]
     assert isinstance(rule, CheckpointRangeRule)
-    assert cast(CheckpointRangeRule, rule).every == 600
+    assert rule.every == 600
 
     assert len(configuration.resume) == 2
 
     assert len(configuration.description.splitlines()) == 3
 
 
-def test_load_file(test_yaml1: str, tmpdir_path: Path) -> None:
-    test_file = tmpdir_path / 'test_yaml1.ymmsl'
-    with test_file.open('w') as f:
-        f.write(test_yaml1)
-
-    with test_file.open('r') as f:
-        configuration = load(f)
+def test_load_version_only() -> None:
+    configuration = load('ymmsl_version: v0.1\n')
+    assert isinstance(configuration, PartialConfiguration)
+    assert not isinstance(configuration, Configuration)
+    assert configuration.model is None
+    assert len(configuration.settings) == 0
 
-    assert configuration.settings is not None
+    with pytest.raises(RecognitionError):
+        load('ymmsl_version: v0.2\n')
 
 
-def test_load_path(test_yaml1: str, tmpdir_path: Path) -> None:
-    test_file = tmpdir_path / 'test_yaml1.ymmsl'
-    with test_file.open('w') as f:
-        f.write(test_yaml1)
-
-    configuration = load(test_file)
+def test_load_file(test_yaml1: str) -> None:
+    configuration = load(StringIO(test_yaml1))
     assert configuration.settings is not None
+    assert configuration.settings['test_int'] == 13
 
 
-def test_dump1(test_yaml1: str, test_config1: PartialConfiguration) -> None:
-    text = dump(test_config1)
-    assert text == test_yaml1
-
-
-def test_dump2(test_yaml2: str, test_config2: PartialConfiguration) -> None:
-    text = dump(test_config2)
-    assert text == test_yaml2
-
-
-def test_dump3(test_yaml3: str, test_config3: PartialConfiguration) -> None:
-    text = dump(test_config3)
-    assert text == test_yaml3
-
-
-def test_dump4(test_yaml4: str, test_config4: PartialConfiguration) -> None:
-    text = dump(test_config4)
-    assert text == test_yaml4
-
-
-def test_dump5(test_yaml5: str, test_config5: Configuration) -> None:
-    text = dump(test_config5)
-    assert text == test_yaml5
-
-
-def test_dump6(test_yaml6: str, test_config6: Configuration) -> None:
-    text = dump(test_config6)
-    assert text == test_yaml6
-
-
-def test_dump7(test_yaml7: str, test_config7: Configuration) -> None:
-    text = dump(test_config7)
-    assert text == test_yaml7
-
-
-def test_dump8(test_yaml8: str, test_config8: Configuration) -> None:
-    text = dump(test_config8)
-    assert text == test_yaml8
+def test_load_path(test_yaml1_file: Path) -> None:
+    configuration = load(test_yaml1_file)
+    assert configuration.settings is not None
 
 
-def test_save_str(test_config1: PartialConfiguration, test_yaml1: str,
-                  tmpdir_path: Path) -> None:
-    test_file = tmpdir_path / 'test_yaml1.ymmsl'
+def test_load_path_error(tmp_path: Path) -> None:
+    test_file = tmp_path / 'test_load_path_error.ymmsl'
+    test_file.write_text('ymmsl_version: v0.1\nmodel: 13\n')
 
-    save(test_config1, str(test_file))
+    with pytest.raises(RecognitionError, match='test_load_path_error.ymmsl'):
+        load(test_file)
 
     with test_file.open('r') as f:
-        yaml_out = f.read()
+        with pytest.raises(
+                RecognitionError, match='test_load_path_error.ymmsl'):
+            load(f)
+
 
-    assert yaml_out == test_yaml1
+@pytest.mark.parametrize('index', range(1, 10))
+def test_dump(index: int, request: Any) -> None:
+    test_yaml = request.getfixturevalue('test_yaml{}'.format(index))
+    test_config = request.getfixturevalue('test_config{}'.format(index))
+    text = dump(test_config)
+    assert text == test_yaml
 
 
-def test_save_path(test_config2: PartialConfiguration, test_yaml2: str,
-                   tmpdir_path: Path) -> None:
-    test_file = tmpdir_path / 'test_yaml1.ymmsl'
+@pytest.mark.parametrize('target_type', [str, Path])
+def test_save(
+        target_type: Any, test_config2: PartialConfiguration,
+        test_yaml2: str, tmp_path: Path) -> None:
+    test_file = tmp_path / 'test_yaml1.ymmsl'
 
-    save(test_config2, test_file)
+    save(test_config2, target_type(test_file))
 
     with test_file.open('r') as f:
         yaml_out = f.read()
@@ -245,17 +229,108 @@ def test_save_path(test_config2: PartialConfiguration, test_yaml2: str,
     assert yaml_out == test_yaml2
 
 
-def test_save_file(test_config2: PartialConfiguration, test_yaml2: str,
-                   tmpdir_path: Path) -> None:
-    test_file = tmpdir_path / 'test_yaml1.ymmsl'
-
-    with test_file.open('w') as f:
-        save(test_config2, f)
-
-    with test_file.open('r') as f:
-        yaml_out = f.read()
-
-    assert yaml_out == test_yaml2
+@pytest.mark.parametrize('index', range(1, 10))
+def test_save_file(index: int, request: Any) -> None:
+    test_yaml = request.getfixturevalue('test_yaml{}'.format(index))
+    test_config = request.getfixturevalue('test_config{}'.format(index))
+
+    f = StringIO()
+    save(test_config, f)
+    assert f.getvalue() == test_yaml
+
+
+def test_load_cached(test_yaml2: str) -> None:
+    configuration1 = load(test_yaml2)
+    assert isinstance(configuration1.model, Model)
+    configuration1.model.components.pop()
+
+    configuration2 = load(test_yaml2)
+    assert configuration2 is not configuration1
+    assert isinstance(configuration2.model, Model)
+    assert len(configuration2.model.components) == 5
+
+
+def test_load_cached_threads(
+        test_yaml1: str, test_yaml2: str, test_yaml3: str,
+        monkeypatch: Any) -> None:
+    # a tiny cache makes the threads evict each other's documents
+    monkeypatch.setattr(ymmsl.io, '_CACHE_SIZE', 1)
+    monkeypatch.setattr(ymmsl.io, '_cache', OrderedDict())
+
+    errors = list()     # type: List[Exception]
+
+    def load_repeatedly(text: str) -> None:
+        try:
+            for _ in range(20):
+                load(text)
+        except Exception as e:  # pylint: disable=broad-except
+            errors.append(e)
+
+    threads = [
+            Thread(target=load_repeatedly, args=(text,))
+            for text in (test_yaml1, test_yaml2, test_yaml3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+@pytest.mark.parametrize('index', [5, 9])
+def test_pure_python_yaml(index: int, request: Any, monkeypatch: Any) -> None:
+    # libyaml is used for loading if available, check that the fallback
+    # gives the same result
+    test_yaml = request.getfixturevalue('test_yaml{}'.format(index))
+    test_config = request.getfixturevalue('test_config{}'.format(index))
+
+    monkeypatch.setattr(ymmsl.io, '_Loader', ymmsl.io._PyLoader)
+    monkeypatch.setattr(ymmsl.io, '_cache', OrderedDict())
+
+    configuration = load(test_yaml)
+    assert type(configuration) is type(test_config)
+    assert dump(configuration) == test_yaml
+
+
+def test_import_without_libyaml(test_yaml5: str) -> None:
+    # ymmsl.io picks its loader at import time, so reload it
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setitem(sys.modules, 'yaml.cyaml', None)
+            importlib.reload(ymmsl.io)
+
+        assert ymmsl.io._Loader is ymmsl.io._PyLoader
+        configuration = load(test_yaml5)
+        assert isinstance(configuration, Configuration)
+        assert dump(configuration) == test_yaml5
+    finally:
+        importlib.reload(ymmsl.io)
+
+
+def test_import_without_yatiml_loader(
+        test_yaml5: str, tmp_path: Path) -> None:
+    load_function = yatiml.load_function
+
+    def load_function_without_loader(*args: Any) -> Any:
+        load_yaml = load_function(*args)
+        return lambda source: load_yaml(source)
+
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(yatiml, 'load_function', load_function_without_loader)
+            importlib.reload(ymmsl.io)
+
+        assert ymmsl.io._Loader is None
+        configuration = load(test_yaml5)
+        assert isinstance(configuration, Configuration)
+        assert dump(configuration) == test_yaml5
+
+        test_file = tmp_path / 'invalid.ymmsl'
+        test_file.write_text('ymmsl_version: v0.1\nmodel: 13\n')
+        with pytest.raises(RecognitionError, match='invalid.ymmsl'):
+            load(test_file)
+    finally:
+        importlib.reload(ymmsl.io)
 
 
 def test_resource_requirements() -> None:
@@ -7,20 +7,27 @@ from ymmsl import (Component, Conduit, Identifier, Model, ModelReference,
                    Ports, Reference, load, dump)
 from ymmsl.model import MulticastConduit
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def load_model() -> Callable:
     return yatiml.load_function(
             Model, Component, Conduit, Identifier, Ports, Reference,
             MulticastConduit)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def dump_model() -> Callable:
     return yatiml.dumps_function(
             Component, Conduit, Identifier, Model, Ports, Reference,
             MulticastConduit)
 
 
+@pytest.fixture(scope='module')
+def load_model_reference() -> Callable:
+    return yatiml.load_function(
+            ModelReference, Component, Conduit, Identifier, Model,
+            MulticastConduit, Reference)
+
+
 @pytest.fixture
 def macro_micro() -> Model:
     macro = Component('macro', 'my.macro', ports=Ports(
@@ -36,16 +43,16 @@ def macro_micro() -> Model:
 
 def test_conduit() -> None:
     test_conduit = Conduit('submodel1.port1', 'submodel2.port2')
-    assert str(test_conduit.sender[0]) == 'submodel1'
-    assert str(test_conduit.sender[1]) == 'port1'
-    assert str(test_conduit.receiver[0]) == 'submodel2'
-    assert str(test_conduit.receiver[1]) == 'port2'
+    assert test_conduit.sender[0] == 'submodel1'
+    assert test_conduit.sender[1] == 'port1'
+    assert test_conduit.receiver[0] == 'submodel2'
+    assert test_conduit.receiver[1] == 'port2'
 
-    assert str(test_conduit.sending_component()) == 'submodel1'
-    assert str(test_conduit.sending_port()) == 'port1'
+    assert test_conduit.sending_component() == 'submodel1'
+    assert test_conduit.sending_port() == 'port1'
     assert test_conduit.sending_slot() == []
-    assert str(test_conduit.receiving_component()) == 'submodel2'
-    assert str(test_conduit.receiving_port()) == 'port2'
+    assert test_conduit.receiving_component() == 'submodel2'
+    assert test_conduit.receiving_port() == 'port2'
     assert test_conduit.receiving_slot() == []
 
     with pytest.raises(ValueError):
@@ -67,24 +74,20 @@ def test_conduit() -> None:
     test_conduit4 = Conduit('x.y[1][2]', 'a.b[3]')
     assert test_conduit4.sender[2] == 1
     assert test_conduit4.sender[3] == 2
-    assert str(test_conduit4.sending_component()) == 'x'
-    assert str(test_conduit4.sending_port()) == 'y'
+    assert test_conduit4.sending_component() == 'x'
+    assert test_conduit4.sending_port() == 'y'
     assert test_conduit4.sending_slot() == [1, 2]
     assert test_conduit4.receiver[2] == 3
-    assert str(test_conduit4.receiving_component()) == 'a'
-    assert str(test_conduit4.receiving_port()) == 'b'
+    assert test_conduit4.receiving_component() == 'a'
+    assert test_conduit4.receiving_port() == 'b'
     assert test_conduit4.receiving_slot() == [3]
 
 
-def test_load_model_reference() -> None:
-    load = yatiml.load_function(
-            ModelReference, Component, Conduit, Identifier, Model,
-            MulticastConduit, Reference)
-
+def test_load_model_reference(load_model_reference: Callable) -> None:
     text = 'name: test_model\n'
-    model = load(text)
+    model = load_model_reference(text)
     assert isinstance(model, ModelReference)
-    assert str(model.name) == 'test_model'
+    assert model.name == 'test_model'
 
     text = ('name: test_model\n'
             'components:\n'
@@ -100,13 +103,13 @@ def test_load_model_reference() -> None:
             '  bf.wss_out: bf2smc.in\n'
             '  bf2smc.out: smc.wss_in\n'
             )
-    model = load(text)
+    model = load_model_reference(text)
     assert isinstance(model, Model)
-    assert str(model.name) == 'test_model'
+    assert model.name == 'test_model'
 
 
 def test_model(macro_micro: Model) -> None:
-    assert str(macro_micro.name) == 'macro_micro'
+    assert macro_micro.name == 'macro_micro'
     assert len(macro_micro.components) == 2
     assert len(macro_micro.conduits) == 2
 
@@ -318,16 +321,16 @@ def test_load_model(load_model: Callable) -> None:
             '  bf2smc.out: smc.wss_in\n'
             )
     model = load_model(text)
-    assert str(model.name) == 'test_model'
+    assert model.name == 'test_model'
     assert len(model.components) == 5
-    assert str(model.components[2].implementation) == 'isr2d.blood_flow'
-    assert str(model.components[4].name) == 'bf2smc'
+    assert model.components[2].implementation == 'isr2d.blood_flow'
+    assert model.components[4].name == 'bf2smc'
 
     assert len(model.conduits) == 5
-    assert str(model.conduits[0].sending_component()) == 'ic'
-    assert str(model.conduits[0].sending_port()) == 'out'
-    assert str(model.conduits[3].receiving_component()) == 'bf2smc'
-    assert str(model.conduits[3].receiving_port()) == 'in'
+    assert model.conduits[0].sending_component() == 'ic'
+    assert model.conduits[0].sending_port() == 'out'
+    assert model.conduits[3].receiving_component() == 'bf2smc'
+    assert model.conduits[3].receiving_port() == 'in'
 
 
 def test_load_no_conduits(load_model: Callable) -> None:
@@ -337,10 +340,10 @@ def test_load_no_conduits(load_model: Callable) -> None:
             )
 
     model = load_model(text)
-    assert str(model.name) == 'test_model'
+    assert model.name == 'test_model'
     assert len(model.components) == 1
-    assert str(model.components[0].name) == 'smc'
-    assert str(model.components[0].implementation) == 'isr2d.smc'
+    assert model.components[0].name == 'smc'
+    assert model.components[0].implementation == 'isr2d.smc'
     assert isinstance(model.conduits, list)
     assert len(model.conduits) == 0
 
@@ -8,6 +8,12 @@ import yatiml
 import pytest
 
 
+load_settings = yatiml.load_function(Settings, Identifier, Reference)
+
+
+dump_settings = yatiml.dumps_function(Identifier, Reference, Settings)
+
+
 @pytest.fixture
 def settings() -> Settings:
     return Settings()
@@ -81,6 +87,16 @@ def test_equality(settings: Settings) -> None:
     assert settings1 != 'test'
     assert not (settings4 == 13)
 
+    settings5 = Settings()
+    settings5._store = OrderedDict([
+            (Reference('z'), [1.4, 5.3]), (Reference('y'), 'test'),
+            (Reference('x'), 12)])
+    settings6 = Settings()
+    settings6._store = OrderedDict(settings1._store)
+
+    assert settings5 == settings6
+    assert settings6 == settings1
+
 
 def test_to_string(settings: Settings) -> None:
     assert str(settings) == 'OrderedDict()'
@@ -198,8 +214,6 @@ def test_as_ordered_dict(settings: Settings) -> None:
 
 
 def test_load_settings() -> None:
-    load_settings = yatiml.load_function(Settings, Identifier, Reference)
-
     text = ('domain1._muscle_grain: [0.01]\n'
             'domain1._muscle_extent: [1.5]\n'
             'submodel1._muscle_timestep: 0.001\n'
@@ -225,8 +239,6 @@ def test_load_settings() -> None:
 
 
 def test_dump_settings() -> None:
-    dump_settings = yatiml.dumps_function(Identifier, Reference, Settings)
-
     settings = Settings(OrderedDict([
             ('domain1._muscle_grain', [0.01]),
             ('domain1._muscle_extent', [1.5]),
@@ -12,6 +12,7 @@ class CheckpointRule:
     There are two flavors of rules: :class:`CheckpointRangeRule` and
     :class:`CheckpointAtRule`. Do not use this class directly.
     """
+    __slots__ = ()
 
 
 class CheckpointRangeRule(CheckpointRule):
@@ -33,6 +34,7 @@ class CheckpointRangeRule(CheckpointRule):
         stop: Stopping criterium of the range.
         every: Step size of the range, must be positive.
     """
+    __slots__ = ('start', 'stop', 'every')
 
     def __init__(self,
                  start: Optional[Union[float, int]] = None,
@@ -77,6 +79,7 @@ class CheckpointAtRule(CheckpointRule):
     Attributes:
         at: List of checkpoints.
     """
+    __slots__ = ('at',)
 
     def __init__(self, at: Optional[List[Union[float, int]]]) -> None:
         """Create checkpoint rules.
@@ -126,6 +129,8 @@ class Checkpoints:
         wallclock_time: Checkpoint rules for the wallclock_time trigger.
         simulation_time: Checkpoint rules for the simulation_time trigger.
     """
+    __slots__ = ('at_end', 'wallclock_time', 'simulation_time')
+
     def __init__(self,
                  at_end: bool = False,
                  wallclock_time: Optional[List[CheckpointRule]] = None,
@@ -47,6 +47,7 @@ class Port:
         operator: The MMSL operator in which this port is used.
 
     """
+    __slots__ = ('name', 'operator')
 
     def __init__(self, name: Identifier, operator: Operator) -> None:
         """Create a Port.
@@ -83,6 +84,8 @@ class Ports:
         s: The ports associated with the S operator.
         o_f: The ports associated with the O_F operator
     """
+    __slots__ = ('f_init', 'o_i', 's', 'o_f')
+
     def __init__(
             self, f_init: Union[None, str, List[str]] = None,
             o_i: Union[None, str, List[str]] = None,
@@ -185,6 +188,7 @@ class Component:
                 organised by operator. None if not specified.
 
     """
+    __slots__ = ('name', 'implementation', 'multiplicity', 'ports')
 
     def __init__(self, name: str, implementation: Optional[str] = None,
                  multiplicity: Union[None, int, List[int]] = None,
@@ -224,10 +228,8 @@ class Component:
 
     def __str__(self) -> str:
         """Returns a string representation of the object."""
-        result = str(self.name)
-        for dim in self.multiplicity:
-            result += '[0:{}]'.format(dim)
-        return result
+        return str(self.name) + ''.join(
+                '[0:{}]'.format(dim) for dim in self.multiplicity)
 
     def __repr__(self) -> str:
         """Returns a string representation of the object."""
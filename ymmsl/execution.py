@@ -110,6 +110,10 @@ class Implementation:
         keeps_state_for_next_use: Does this implementation keep state for the
             next iteration of the reuse loop. See :class:`ImplementationState`.
     """
+    __slots__ = (
+            'name', 'script', 'modules', 'virtual_env', 'env',
+            'execution_model', 'executable', 'args', 'can_share_resources',
+            'keeps_state_for_next_use')
 
     def __init__(
             self,
@@ -251,6 +255,8 @@ class ResourceRequirements:
     Attributes:
         name: Name of the component to configure.
     """
+    __slots__ = ('name',)
+
     def __init__(self, name: Reference) -> None:
         """Create a ResourceRequirements description.
 
@@ -276,6 +282,7 @@ class ThreadedResReq(ResourceRequirements):
         name: Name of the component to configure.
         threads: Number of threads/cores per instance.
     """
+    __slots__ = ('threads',)
 
     def __init__(self, name: Reference, threads: int) -> None:
         """Create a ThreadedResourceRequirements description.
@@ -299,6 +306,7 @@ class MPICoresResReq(ResourceRequirements):
         mpi_processes: Number of MPI processes to start.
         threads_per_mpi_process: Number of threads/cores per process.
     """
+    __slots__ = ('mpi_processes', 'threads_per_mpi_process')
 
     def __init__(
             self, name: Reference, mpi_processes: int,
@@ -333,6 +341,8 @@ class MPINodesResReq(ResourceRequirements):
                 each node.
         threads_per_mpi_process: Number of threads/cores per process.
     """
+    __slots__ = (
+            'nodes', 'mpi_processes_per_node', 'threads_per_mpi_process')
 
     def __init__(
             self, name: Reference, nodes: int,
@@ -1,20 +1,29 @@
 """This module contains definitions for identity."""
-from copy import copy
+from functools import lru_cache
 import re
-from collections import UserString
-from typing import Any, Generator, Iterable, List, overload, Union
+from typing import Optional     # noqa: F401
+from typing import Any, Dict, Iterable, Iterator, List, overload, Tuple, Union
 
 import yatiml
 
 
-class Identifier(UserString):
+# Matches References in canonical form, i.e. those that are written exactly
+# the way _parts_to_string() would write them.
+_CANONICAL_REFERENCE = re.compile(
+        r'[a-zA-Z_][a-zA-Z0-9_]*'
+        r'(?:\.[a-zA-Z_][a-zA-Z0-9_]*|\[(?:0|-?[1-9][0-9]*)\])*')
+
+
+class Identifier(str):
     """A custom string type that represents an identifier.
 
     An identifier may consist of upper- and lowercase characters, digits, and \
     underscores.
     """
 
-    def __init__(self, seq: Any) -> None:
+    __slots__ = ()
+
+    def __new__(cls, seq: Any) -> 'Identifier':
         """Create an Identifier.
 
         This creates a new identifier object, using the string
@@ -25,14 +34,23 @@ class Identifier(UserString):
                     not form a valid Identifier.
 
         """
-        super().__init__(seq)
-        if not re.fullmatch(
-                r'[a-zA-Z_]\w*', self.data, flags=re.ASCII):    # type: ignore
+        data = str(seq)
+        # For ASCII strings, Python's identifier syntax is exactly ours
+        if not (data.isascii() and data.isidentifier()):
             raise ValueError('Identifiers must consist only of'
                              ' lower- and uppercase letters, digits and'
                              ' underscores, must start with a letter or'
                              ' an underscore, and must not be empty.'
-                             ' "{}" is therefore invalid.'.format(self.data))
+                             ' "{}" is therefore invalid.'.format(data))
+        return super().__new__(cls, data)
+
+    def __copy__(self) -> 'Identifier':
+        """Returns the Identifier itself, as it is immutable."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Identifier':
+        """Returns the Identifier itself, as it is immutable."""
+        return self
 
 
 ReferencePart = Union[Identifier, int]
@@ -64,8 +82,14 @@ class Reference(yatiml.String):
     try to change any of the elements. Instead, make a new Reference.
     Especially References that are used as dictionary keys must not be
     modified, this will get your dictionary in a very confused state.
+
+    A Reference created from a string in canonical form is only split
+    into parts when the parts are actually needed, so that using it as
+    a dictionary key or converting it back to a string is cheap.
     """
 
+    __slots__ = ('_str', '_parts')
+
     def __init__(self, parts: Union[str, List[ReferencePart]]) -> None:
         """Create a Reference.
 
@@ -80,17 +104,57 @@ class Reference(yatiml.String):
                     Reference.
 
         """
+        self._str = None    # type: Optional[str]
+        self._parts = None  # type: Optional[Tuple[ReferencePart, ...]]
         if isinstance(parts, str):
-            self._parts = self._string_to_parts(parts)
+            if _CANONICAL_REFERENCE.fullmatch(parts):
+                self._str = parts
+            else:
+                self._parts = _parse_reference(parts)
         elif len(parts) > 0 and not isinstance(parts[0], Identifier):
             raise ValueError(
                     'The first part of a Reference must be an Identifier')
         else:
-            self._parts = parts
+            self._parts = tuple(parts)
+
+    @classmethod
+    def _from_trusted_parts(
+            cls, parts: Tuple[ReferencePart, ...]) -> 'Reference':
+        """Create a Reference from parts that are known to be valid.
+
+        This skips parsing and validation, and is used to make new
+        References out of the parts of existing ones, e.g. when slicing
+        or concatenating.
+
+        Args:
+            parts: The parts of the new Reference. The first one must
+                    be an Identifier.
+
+        """
+        ref = object.__new__(cls)
+        ref._str = None
+        ref._parts = parts
+        return ref
+
+    def _ensure_parts(self) -> Tuple[ReferencePart, ...]:
+        """Return the parts, splitting the string form if needed."""
+        if self._parts is None:
+            self._parts = _parse_reference(str(self._str))
+        return self._parts
+
+    def __copy__(self) -> 'Reference':
+        """Returns the Reference itself, as it is immutable."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Reference':
+        """Returns the Reference itself, as it is immutable."""
+        return self
 
     def __str__(self) -> str:
         """Convert the Reference to string form."""
-        return self._parts_to_string(self._parts)
+        if self._str is None:
+            self._str = self._parts_to_string(self._ensure_parts())
+        return self._str
 
     def __repr__(self) -> str:
         """Produce a representation in string form."""
@@ -98,7 +162,7 @@ class Reference(yatiml.String):
 
     def __len__(self) -> int:
         """Return the number of parts in the Reference."""
-        return len(self._parts)
+        return len(self._ensure_parts())
 
     def __hash__(self) -> int:
         """Calculate a hash value for use by dicts."""
@@ -107,33 +171,31 @@ class Reference(yatiml.String):
     def __eq__(self, other: Any) -> bool:
         """Compare for equality.
 
-        Will compare part-by-part if the other argument is a Reference,
-        or string representations if the other argument is a string.
+        Compares string representations, which are equal if and only
+        if the parts are equal, so that neither side needs to be split
+        into parts.
 
         Args:
             other: Another Reference or a string.
 
         """
-        if isinstance(other, Reference):
-            return self._parts == other._parts
-        if isinstance(other, str):
-            return str(self) == other
+        if isinstance(other, (Reference, str)):
+            return str(self) == str(other)
         return NotImplemented
 
     def __ne__(self, other: Any) -> bool:
         """Compare for equality.
 
-        Will compare part-by-part if the other argument is a Reference,
-        or string representations if the other argument is a string.
+        Compares string representations, which are equal if and only
+        if the parts are equal, so that neither side needs to be split
+        into parts.
 
         Args:
             other: Another Reference or a string.
 
         """
-        if isinstance(other, Reference):
-            return self._parts != other._parts
-        if isinstance(other, str):
-            return str(self) != other
+        if isinstance(other, (Reference, str)):
+            return str(self) != str(other)
         return NotImplemented
 
     def __lt__(self, other: Any) -> bool:
@@ -143,10 +205,12 @@ class Reference(yatiml.String):
             other: Another Reference or a string.
         """
         if isinstance(other, Reference):
+            self_parts = self._ensure_parts()
+            other_parts = other._ensure_parts()
             i = 0
-            while i < min(len(self._parts), len(other._parts)):
-                s = self._parts[i]
-                o = other._parts[i]
+            while i < min(len(self_parts), len(other_parts)):
+                s = self_parts[i]
+                o = other_parts[i]
 
                 if isinstance(s, int) and isinstance(o, int):
                     if s < o:
@@ -163,22 +227,21 @@ class Reference(yatiml.String):
                 elif isinstance(s, Identifier) and isinstance(o, int):
                     return False
                 i += 1
-            return len(self._parts) < len(other._parts)
+            return len(self_parts) < len(other_parts)
 
         if isinstance(other, str):
             return self < Reference(other)
 
         return NotImplemented
 
-    def __iter__(self) -> Generator[ReferencePart, None, None]:
+    def __iter__(self) -> Iterator[ReferencePart]:
         """Iterate through the parts.
 
-        Yields:
-            Each part in turn from left to right.
+        Returns:
+            An iterator over the parts, from left to right.
 
         """
-        for part in self._parts:
-            yield part
+        return iter(self._ensure_parts())
 
     @overload
     def __getitem__(self, key: int) -> ReferencePart: ...
@@ -207,9 +270,13 @@ class Reference(yatiml.String):
 
         """
         if isinstance(key, int):
-            return self._parts[key]
+            return self._ensure_parts()[key]
         if isinstance(key, slice):
-            return Reference(self._parts[key])
+            parts = self._ensure_parts()[key]
+            if len(parts) > 0 and not isinstance(parts[0], Identifier):
+                raise ValueError(
+                        'The first part of a Reference must be an Identifier')
+            return Reference._from_trusted_parts(parts)
         raise ValueError('Subscript must be either an int or a slice')
 
     def __setitem__(self, key: Union[int, slice], value: Any) -> None:
@@ -241,28 +308,36 @@ class Reference(yatiml.String):
             A new concatenated Reference.
 
         """
-        ret = Reference(copy(self._parts))
+        parts = self._ensure_parts()
         if isinstance(other, Reference):
-            ret._parts.extend(other._parts)
+            parts += other._ensure_parts()
         elif isinstance(other, (Identifier, int)):
-            ret._parts.append(other)
+            parts += (other,)
         elif hasattr(other, '__iter__'):
-            ret._parts.extend(other)
-        return ret
+            parts += tuple(other)
+        return Reference._from_trusted_parts(parts)
 
     def without_trailing_ints(self) -> 'Reference':
         """Returns a copy of this Reference with trailing ints removed.
 
+        If there are no trailing ints, then this Reference is returned
+        itself, which is fine as References are immutable.
+
         Examples:
             a.b.c[1][2] -> a.b.c
             a[1].b.c -> a[1].b.c
             a.b.c -> a.b.c
             a[1].b.c[2] -> a[1].b.c
         """
-        i = len(self._parts) - 1
-        while i > 0 and isinstance(self._parts[i], int):
+        # Only an int part is written with a closing bracket at the end
+        if not str(self).endswith(']'):
+            return self
+
+        parts = self._ensure_parts()
+        i = len(parts)
+        while i > 1 and isinstance(parts[i - 1], int):
             i -= 1
-        return Reference(self._parts[0:i+1])
+        return Reference._from_trusted_parts(parts[:i])
 
     @classmethod
     def _string_to_parts(cls, text: str) -> List[ReferencePart]:
@@ -313,7 +388,7 @@ class Reference(yatiml.String):
         return parts
 
     @classmethod
-    def _parts_to_string(cls, parts: List[ReferencePart]) -> str:
+    def _parts_to_string(cls, parts: Tuple[ReferencePart, ...]) -> str:
         """Convert a list of parts to its string representation.
 
         Args:
@@ -330,3 +405,22 @@ class Reference(yatiml.String):
             else:
                 text += '.{}'.format(part)
         return text
+
+
+@lru_cache(maxsize=4096)
+def _parse_reference(text: str) -> Tuple[ReferencePart, ...]:
+    """Parse a string into a tuple of Reference parts.
+
+    The same References tend to be parsed many times over, e.g. the
+    names of components that occur in many conduits, so this caches
+    the results. The parts are immutable, so they can be shared.
+
+    Args:
+        text: The string to parse.
+
+    Raises:
+        ValueError: If the string does not represent a valid
+                Reference.
+
+    """
+    return tuple(Reference._string_to_parts(text))
@@ -1,7 +1,12 @@
 """Loading and saving functions."""
+from collections import OrderedDict
+import copy
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Any, IO, Union
+import threading
+from typing import Any, IO, Optional, Union
 
+import yaml
 import yatiml
 
 from ymmsl.checkpoint import (
@@ -29,9 +34,115 @@ _classes = (
 _load = yatiml.load_function(*_classes)
 
 
+def _loader_class(load_function: Any) -> Any:
+    """Returns the PyYAML Loader class used by a YAtiML load function.
+
+    YAtiML has no public API for getting at this class, but its load
+    function objects keep it in their ``loader`` attribute. We need it
+    to derive a loader that parses using libyaml, and to load text that
+    we have already read ourselves for caching. This is the only place
+    that depends on this YAtiML implementation detail.
+
+    Returns:
+        The Loader class, or None if the load function does not have
+        one, in which case we load through the load function itself.
+    """
+    return getattr(load_function, 'loader', None)
+
+
+_PyLoader = _loader_class(_load)
+
+
+_Loader = _PyLoader     # type: Any
+
+
+if yaml.__with_libyaml__ and _PyLoader is not None:
+    try:
+        from yaml.cyaml import CParser     # type: ignore
+    except ImportError:
+        pass
+    else:
+        class _CLoader(CParser, _PyLoader):     # type: ignore
+            """Loader that uses libyaml to parse the input.
+
+            YAtiML hooks into PyYAML through get_single_node(), so we
+            use its version rather than CParser's. That builds the nodes
+            in Python, from the events produced by libyaml.
+            """
+            def __init__(self, stream: Any) -> None:
+                """Create a _CLoader reading from the given stream."""
+                _PyLoader.__init__(self, '')
+                CParser.__init__(self, stream)
+
+            get_single_node = _PyLoader.get_single_node
+
+        _Loader = _CLoader
+
+
+_CACHE_SIZE = 128
+
+
+_CacheKey = Union[str, bytes]
+
+
+_cache = OrderedDict()  # type: OrderedDict[_CacheKey, PartialConfiguration]
+
+
+# load() may be called from several threads at once
+_cache_lock = threading.Lock()
+
+
+def _load_cached(
+        text: Union[str, bytes], name: Optional[str] = None
+        ) -> PartialConfiguration:
+    """Loads a document, reusing the result of an earlier load.
+
+    The most recently loaded documents are kept, keyed by their
+    contents. Since configurations can be modified, a copy of the
+    stored object is returned. The cache is protected by a lock, but
+    parsing is done outside of it, so that threads loading different
+    documents do not wait for each other.
+
+    Args:
+        text: The YAML data to load.
+        name: Name of the file the data came from, if any, for use
+                in error messages.
+
+    Returns:
+        A PartialConfiguration object corresponding to the input data.
+
+    """
+    with _cache_lock:
+        configuration = _cache.get(text)
+        if configuration is not None:
+            _cache.move_to_end(text)
+
+    if configuration is None:
+        stream = (
+                StringIO(text) if isinstance(text, str)
+                else BytesIO(text))     # type: Any
+        if name is not None:
+            stream.name = name
+
+        if _Loader is None:
+            configuration = _load(stream)
+        else:
+            configuration = yaml.load(stream, Loader=_Loader)
+
+        with _cache_lock:
+            _cache[text] = configuration
+            if len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    return copy.deepcopy(configuration)
+
+
 def load(source: Union[str, Path, IO[Any]]) -> PartialConfiguration:
     """Loads a yMMSL document from a string or a file.
 
+    Recently loaded documents are cached, so loading the same data
+    again is fast.
+
     Args:
         source: A string containing yMMSL data, a pathlib Path to a
                 file containing yMMSL data, or an open file-like
@@ -41,8 +152,14 @@ def load(source: Union[str, Path, IO[Any]]) -> PartialConfiguration:
         A PartialConfiguration object corresponding to the input data.
 
     """
-    # This wrapper is just here to render the documentation.
-    return _load(source)
+    if isinstance(source, str):
+        return _load_cached(source)
+
+    if isinstance(source, Path):
+        with source.open('r') as f:
+            return _load_cached(f.read(), str(source))
+
+    return _load_cached(source.read(), getattr(source, 'name', None))
 
 
 _dump = yatiml.dumps_function(*_classes)
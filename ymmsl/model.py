@@ -1,5 +1,6 @@
 """This module contains all the definitions for yMMSL."""
 from collections import OrderedDict
+import re
 from typing import Any, List, Optional, Union, cast
 from typing import Dict     # noqa
 
@@ -10,6 +11,11 @@ from ymmsl.component import Component
 from ymmsl.identity import Identifier, Reference
 
 
+# Matches the string form of a valid conduit endpoint: at least a component
+# and a port name, optionally followed by a slot.
+_ENDPOINT = re.compile(r'[^.\[]+(?:\.[^.\[]+)+(?:\[[^\]]+\])*')
+
+
 class Conduit:
     """A conduit transports data between simulation components.
 
@@ -25,6 +31,7 @@ class Conduit:
         receiver: The receiving port that this conduit is connected to.
 
     """
+    __slots__ = ('sender', 'receiver')
 
     def __init__(self, sender: str, receiver: str) -> None:
         """Create a Conduit.
@@ -54,6 +61,10 @@ class Conduit:
     @staticmethod
     def __check_reference(ref: Reference) -> None:
         """Checks an endpoint for validity."""
+        if _ENDPOINT.fullmatch(str(ref)):
+            return
+
+        # find out what is wrong, so we can give a helpful error
         # check that subscripts are at the end
         for i, part in enumerate(ref):
             if isinstance(part, int):
@@ -119,12 +130,10 @@ class Conduit:
         reference. If the reference does not end in an int, returns
         an empty list.
         """
-        result = list()     # type: List[int]
-        i = len(reference) - 1
-        while isinstance(reference[i], int):
-            result.insert(0, cast(int, reference[i]))
-            i -= 1
-        return result
+        stem = reference.without_trailing_ints()
+        if stem is reference:
+            return list()
+        return cast(List[int], list(reference)[len(stem):])
 
     @staticmethod
     def __stem(reference: Reference) -> Reference:
@@ -132,10 +141,7 @@ class Conduit:
 
         If there is no slot, returns the whole reference.
         """
-        i = len(reference)
-        while isinstance(reference[i-1], int):
-            i -= 1
-        return reference[:i]    # type: ignore
+        return reference.without_trailing_ints()
 
 
 class MulticastConduit:
@@ -153,6 +159,7 @@ class MulticastConduit:
     Once parsed and populated in :class:`Model`, a multicast is identified by
     two or more conduits with the same :attr:`Conduit.sender`.
     """
+    __slots__ = ('sender', 'receiver', '_conduits')
 
     def __init__(self, sender: str, receiver: List[str]) -> None:
         """Create a Multicast Conduit.
@@ -255,21 +262,24 @@ class Model(ModelReference):
         """
         self.name = overlay.name
         # update components
+        indices = dict()    # type: Dict[Reference, int]
+        for i, oldc in enumerate(self.components):
+            indices.setdefault(oldc.name, i)
+
         for newc in overlay.components:
-            for i, oldc in enumerate(self.components):
-                if oldc.name == newc.name:
-                    self.components[i] = newc
-                    break
+            if newc.name in indices:
+                self.components[indices[newc.name]] = newc
             else:
+                indices[newc.name] = len(self.components)
                 self.components.append(newc)
 
         # remove overwritten conduits
-        for newt in overlay.conduits:
-            for oldt in self.conduits.copy():
-                # Multiple conduits can be connected to one sending port
-                # (multicast), only overwrite connections to a receiving port
-                if oldt.receiver == newt.receiver:
-                    self.conduits.remove(oldt)
+        # Multiple conduits can be connected to one sending port
+        # (multicast), only overwrite connections to a receiving port
+        new_receivers = {newt.receiver for newt in overlay.conduits}
+        self.conduits[:] = [
+                oldt for oldt in self.conduits
+                if oldt.receiver not in new_receivers]
 
         # add new conduits
         self.conduits.extend(overlay.conduits)
@@ -281,40 +291,39 @@ class Model(ModelReference):
         components, and will raise a RuntimeError with an explanation
         if one is not.
         """
+        components = dict()     # type: Dict[Reference, List[Component]]
+        for comp in self.components:
+            components.setdefault(comp.name, []).append(comp)
+
         def component_exists(name: Reference) -> bool:
-            for comp in self.components:
-                if comp.name == name:
-                    return True
-            return False
+            return name in components
 
         def component_has_receiving_port(
                 component: Reference, port: Identifier) -> bool:
             if port == 'muscle_settings_in':
                 return True
-            for comp in self.components:
-                if comp.name == component:
-                    if not comp.ports:
-                        return True
+            for comp in components.get(component, []):
+                if not comp.ports:
+                    return True
 
-                    try:
-                        if comp.ports.operator(port).allows_receiving():
-                            return True
-                    except KeyError:
-                        pass
+                try:
+                    if comp.ports.operator(port).allows_receiving():
+                        return True
+                except KeyError:
+                    pass
             return False
 
         def component_has_sending_port(
                 component: Reference, port: Identifier) -> bool:
-            for comp in self.components:
-                if comp.name == component:
-                    if not comp.ports:
-                        return True
+            for comp in components.get(component, []):
+                if not comp.ports:
+                    return True
 
-                    try:
-                        if comp.ports.operator(port).allows_sending():
-                            return True
-                    except KeyError:
-                        pass
+                try:
+                    if comp.ports.operator(port).allows_sending():
+                        return True
+                except KeyError:
+                    pass
             return False
 
         receivers_seen = set()
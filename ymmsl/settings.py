@@ -2,6 +2,7 @@
 from collections import OrderedDict
 from collections.abc import MutableMapping
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import yatiml
@@ -14,12 +15,23 @@ SettingValue = Union[
         yatiml.bool_union_fix]
 
 
+@lru_cache(maxsize=4096)
+def _ref_from_str(key: str) -> Reference:
+    """Converts a setting name to a Reference.
+
+    The same few setting names tend to be used over and over, and
+    References are immutable, so we reuse them.
+    """
+    return Reference(key)
+
+
 class Settings(MutableMapping):
     """Settings for doing an experiment.
 
     An experiment is done by running a model with particular settings, \
     for the submodel scales, model parameters and any other configuration.
     """
+    __slots__ = ('_store',)
 
     def __init__(
             self,
@@ -34,11 +46,13 @@ class Settings(MutableMapping):
             settings: Setting values to initialise a model with.
 
         """
-        self._store = OrderedDict()  # type: Dict[Reference, SettingValue]
-
-        if settings is not None:
-            for key, value in settings.items():
-                self[key] = deepcopy(value)
+        if settings is None:
+            self._store = dict()    # type: Dict[Reference, SettingValue]
+        else:
+            self._store = {
+                    _ref_from_str(key) if isinstance(key, str) else key:
+                    deepcopy(value)
+                    for key, value in settings.items()}
 
     def __eq__(self, other: Any) -> bool:
         """Returns whether keys and values are identical.
@@ -47,7 +61,8 @@ class Settings(MutableMapping):
         """
         if not isinstance(other, Settings):
             return NotImplemented
-        return dict(self._store.items()) == dict(other._store.items())
+        # dict.__eq__ ignores order, even if one of them is an OrderedDict
+        return dict.__eq__(self._store, other._store)
 
     def __str__(self) -> str:
         """Represent as a string."""
@@ -56,20 +71,20 @@ class Settings(MutableMapping):
     def __getitem__(self, key: Union[str, Reference]) -> SettingValue:
         """Returns an item, implements settings[name]."""
         if isinstance(key, str):
-            key = Reference(key)
+            key = _ref_from_str(key)
         return self._store[key]
 
     def __setitem__(self, key: Union[str, Reference], value: SettingValue
                     ) -> None:
         """Sets a value, implements settings[name] = value."""
         if isinstance(key, str):
-            key = Reference(key)
+            key = _ref_from_str(key)
         self._store[key] = value
 
     def __delitem__(self, key: Union[str, Reference]) -> None:
         """Deletes a value, implements del(settings[name])."""
         if isinstance(key, str):
-            key = Reference(key)
+            key = _ref_from_str(key)
         del self._store[key]
 
     def __iter__(self) -> Iterator[Tuple[Reference, SettingValue]]:
@@ -82,10 +97,7 @@ class Settings(MutableMapping):
 
     def ordered_items(self) -> List[Tuple[Reference, SettingValue]]:
         """Return settings as a list of tuples."""
-        result = list()
-        for key, value in self._store.items():
-            result.append((key, value))
-        return result
+        return list(self._store.items())
 
     def copy(self) -> 'Settings':
         """Makes a shallow copy of these settings and returns it."""